@@ -1,19 +1,100 @@
 """
 Email client for handling SMTP and IMAP operations.
 """
+import base64
+import codecs
 import imaplib
+import queue
+import quopri
+import re
 import smtplib
 import email
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.header import decode_header
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from email.message import EmailMessage
+from email.parser import BytesHeaderParser
+from email.utils import parseaddr
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Union
 import os
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Idle connections older than this are logged out by the reaper thread
+# (same default as imapproxy).
+POOL_IDLE_TIMEOUT = 600
+POOL_REAP_INTERVAL = 60
+
+# List views only need a few headers and enough body for a 150-char
+# preview; fetch just those instead of the full (possibly multi-MB)
+# RFC822 message, plus part 1's own MIME headers so the slice can be
+# transfer-decoded. PEEK avoids setting the \Seen flag.
+PREVIEW_BODY_BYTES = 4096
+PREVIEW_HEADER_SECTION = 'HEADER.FIELDS (SUBJECT FROM DATE)'
+PREVIEW_MIME_SECTION = '1.MIME'
+PREVIEW_BODY_SECTION = '1'
+PREVIEW_FETCH_SPEC = (
+    f"(BODY.PEEK[{PREVIEW_HEADER_SECTION}] "
+    f"BODY.PEEK[{PREVIEW_MIME_SECTION}] "
+    f"BODY.PEEK[{PREVIEW_BODY_SECTION}]<0.{PREVIEW_BODY_BYTES}>)"
+)
+
+# Names the section a fetched literal belongs to, e.g. BODY[1.MIME]
+_SECTION_RE = re.compile(rb'BODY\[([^\]]*)\]')
+
+# Flattens newlines in raw preview bytes before decoding, avoiding an
+# intermediate str allocation per email.
+_PREVIEW_TRANS = bytes.maketrans(b'\r\n', b'  ')
+
+# Large fetches are split across this many pooled connections so the
+# transfers overlap; small fetches stay on a single connection where the
+# extra SELECTs would cost more than they save.
+FETCH_CONCURRENCY = 4
+FETCH_SHARD_MIN = 8
+
+# Headers never change once a message exists, so parsed list entries are
+# cached by (folder, UIDVALIDITY, UID). A UIDVALIDITY bump naturally
+# orphans the stale entries; the cache is cleared outright if it grows
+# past this many messages.
+HEADER_CACHE_MAX = 4096
+
+# UID FETCH responses carry the UID inside the untagged prefix
+_UID_RE = re.compile(rb'UID (\d+)')
+
+# RFC 2047 encoded words, e.g. =?utf-8?B?SMOpbGxv?=. Whitespace between
+# two adjacent encoded words carries no meaning and is dropped before
+# decoding. The B/Q dispatch table pads base64 and maps Q's underscore
+# back to a space.
+_ENCODED_WORD_RE = re.compile(r'=\?([^?]+)\?([BbQq])\?([^?]*)\?=')
+_ENCODED_WORD_GAP_RE = re.compile(r'(\?=)\s+(?==\?)')
+_ENCODED_WORD_DECODERS = {
+    'b': lambda text: base64.b64decode(text + '=' * (-len(text) % 4), validate=True),
+    'q': lambda text: quopri.decodestring(text.replace('_', ' ').encode('ascii', 'replace')),
+}
+
+# Control characters are forbidden in IMAP quoted strings; left in, a
+# CR/LF inside a tool argument would be parsed by the server as the
+# start of a new command.
+_CTL_RE = re.compile(r'[\x00-\x1f\x7f]')
+
+# Pre-bound SEARCH atoms so hot calls don't rebuild them
+_SEARCH_UNSEEN = "UNSEEN"
+_SEARCH_SEEN = "SEEN"
+_SEARCH_ALL = "ALL"
+
+# STATUS folder (UNSEEN) responses look like b'INBOX (UNSEEN 3)'
+_STATUS_UNSEEN_RE = re.compile(rb'UNSEEN (\d+)')
+
+# Re-issue IDLE well before the 29-minute limit from RFC 2177, and wait
+# this long before reconnecting after the watcher connection drops.
+IDLE_REFRESH_SECONDS = 840
+IDLE_RETRY_SECONDS = 30
+
 
 class EmailClient:
     """Email client for Gmail using SMTP/IMAP."""
@@ -29,92 +110,500 @@ class EmailClient:
         if not self.email_user or not self.email_pass:
             raise ValueError("EMAIL_USER and EMAIL_PASS must be set in .env file")
 
+        # Pool of live, authenticated IMAP connections. Entries are
+        # (connection, released_at) tuples; a daemon thread reaps
+        # connections that sit idle longer than POOL_IDLE_TIMEOUT.
+        self._pool: queue.Queue = queue.Queue()
+        self._reaper = threading.Thread(target=self._reap_idle, daemon=True)
+        self._reaper.start()
+
+        # Workers for sharded fetches; each shard runs on its own pooled
+        # connection so transfers overlap across TCP windows.
+        self._executor = ThreadPoolExecutor(max_workers=FETCH_CONCURRENCY)
+
+        # (folder, uidvalidity, uid) -> parsed list entry
+        self._header_cache: Dict[tuple, Dict] = {}
+        self._cache_lock = threading.Lock()
+
+        # INBOX unseen count pushed by the IDLE watcher; None until the
+        # watcher has produced a value (or when IDLE is unsupported)
+        self._unread_count: Optional[int] = None
+        self._unread_lock = threading.Lock()
+        self._idle_thread: Optional[threading.Thread] = None
+
     def _connect_imap(self) -> imaplib.IMAP4_SSL:
-        """Connect to IMAP server."""
+        """Open and authenticate a new IMAP connection."""
         mail = imaplib.IMAP4_SSL(self.imap_server, self.imap_port)
         mail.login(self.email_user, self.email_pass)
+        mail._selected_folder = None  # folder cache, see _imap()
         return mail
 
-    def _decode_header(self, header: str) -> str:
-        """Decode email header."""
-        decoded = decode_header(header)
-        result = ""
-        for content, encoding in decoded:
-            if isinstance(content, bytes):
-                result += content.decode(encoding or 'utf-8', errors='ignore')
-            else:
-                result += content
-        return result
+    def _acquire(self) -> imaplib.IMAP4_SSL:
+        """Get a live connection from the pool, opening one if needed."""
+        while True:
+            try:
+                mail, _ = self._pool.get_nowait()
+            except queue.Empty:
+                return self._connect_imap()
+
+            # Verify the pooled connection is still alive before reusing it
+            try:
+                mail.noop()
+                return mail
+            except (imaplib.IMAP4.abort, OSError):
+                self._discard(mail)
+
+    def _release(self, mail: imaplib.IMAP4_SSL):
+        """Return a connection to the pool instead of logging out."""
+        self._pool.put((mail, time.monotonic()))
+
+    @staticmethod
+    def _discard(mail: imaplib.IMAP4_SSL):
+        """Drop a dead or expired connection, ignoring errors."""
+        try:
+            mail.logout()
+        except Exception:
+            pass
+
+    @contextmanager
+    def _imap(self, folder: str):
+        """
+        Context manager yielding a pooled connection with `folder` selected.
+
+        Skips the SELECT round-trip when the connection already has the
+        folder open. Connections that die mid-call are discarded; healthy
+        ones go back to the pool.
+        """
+        mail = self._acquire()
+        try:
+            if mail._selected_folder != folder:
+                # Read-only EXAMINE: nothing here changes flags, and it
+                # spares the server flag writes on every poll
+                mail._selected_folder = None
+                status, data = mail.select(folder, readonly=True)
+                if status != 'OK':
+                    # imaplib reports a NO untagged, without raising
+                    raise imaplib.IMAP4.error(f"SELECT {folder} failed: {data}")
+                mail._selected_folder = folder
+                _, data = mail.response('UIDVALIDITY')
+                mail._uidvalidity = int(data[0]) if data and data[0] else None
+            yield mail
+        except Exception:
+            # Connection state is suspect after any failure; log it out
+            # rather than returning it to the pool or leaking it to GC
+            self._discard(mail)
+            raise
+        else:
+            self._release(mail)
+
+    def _reap_idle(self):
+        """Background loop that logs out connections idle too long."""
+        while True:
+            time.sleep(POOL_REAP_INTERVAL)
+            keep = []
+            while True:
+                try:
+                    mail, released_at = self._pool.get_nowait()
+                except queue.Empty:
+                    break
+                if time.monotonic() - released_at > POOL_IDLE_TIMEOUT:
+                    self._discard(mail)
+                else:
+                    keep.append((mail, released_at))
+            for item in keep:
+                self._pool.put(item)
+
+    @staticmethod
+    def _optimize_sequence(message_ids: List[bytes]) -> str:
+        """
+        Coalesce message ids into a compact IMAP sequence-set.
+
+        e.g. [1, 5, 7, 8, 9, 10, 11, 12, 20] -> "1,5,7:12,20"
+        """
+        ids = sorted(int(num) for num in message_ids)
+        parts = []
+        start = prev = ids[0]
+        for current in ids[1:]:
+            if current == prev + 1:
+                prev = current
+                continue
+            parts.append(str(start) if start == prev else f"{start}:{prev}")
+            start = prev = current
+        parts.append(str(start) if start == prev else f"{start}:{prev}")
+        return ",".join(parts)
+
+    @staticmethod
+    def _fetch_sections(mail, message_ids: List[bytes], spec: str) -> Dict[bytes, Dict[str, bytes]]:
+        """
+        Fetch one or more body sections for many messages in a single
+        FETCH command.
+
+        Issuing one command for the whole sequence-set costs one network
+        round-trip instead of one per message.
+
+        Returns:
+            Mapping of message id (bytes) to a dict of section name
+            (e.g. "1.MIME", "" for the whole message) to payload bytes
+        """
+        if not message_ids:
+            return {}
+
+        sequence = EmailClient._optimize_sequence(message_ids)
+        _, msg_data = mail.uid('FETCH', sequence, spec)
+
+        # The response interleaves (b'N (UID u BODY[...] {size}', payload)
+        # tuples with closing b')' markers. Continuation sections for the
+        # same message have a prefix without the UID, so track the current
+        # uid across tuples; the section a payload belongs to is the last
+        # BODY[...] named in its prefix.
+        sections: Dict[bytes, Dict[str, bytes]] = {}
+        current = None
+        for item in msg_data:
+            if isinstance(item, tuple) and len(item) == 2:
+                prefix, payload = item
+                match = _UID_RE.search(prefix)
+                if match:
+                    current = match.group(1)
+                    sections[current] = {}
+                if current is not None:
+                    names = _SECTION_RE.findall(prefix)
+                    name = names[-1].decode() if names else ""
+                    sections[current][name] = payload
+        return sections
+
+    @staticmethod
+    def _fetch_batch(mail, message_ids: List[bytes], spec: str = "(BODY.PEEK[])") -> Dict[bytes, bytes]:
+        """
+        Fetch many full messages with a single FETCH command.
+
+        BODY.PEEK[] returns the same bytes as RFC822 but never sets the
+        \\Seen flag as a side effect.
+
+        Returns:
+            Mapping of message id (bytes) to raw message bytes
+        """
+        sections = EmailClient._fetch_sections(mail, message_ids, spec)
+        return {num: parts[""] for num, parts in sections.items() if "" in parts}
+
+    @staticmethod
+    def _quote_search_string(value: str) -> str:
+        """
+        Escape a value as an IMAP quoted string for SEARCH criteria.
+
+        Control characters (notably CR/LF, which would inject a new
+        command) are stripped — they cannot appear in a quoted string.
+        """
+        value = _CTL_RE.sub('', value)
+        return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _decode_header(header: str) -> str:
+        """
+        Decode an RFC 2047 encoded email header.
+
+        Headers repeat heavily across same-sender threads, so decoded
+        results are memoized.
+        """
+        # Fast path: headers without encoded words (the common case)
+        # skip the regex machinery entirely
+        if '=?' not in header:
+            return header
+
+        header = _ENCODED_WORD_GAP_RE.sub(r'\1', header)
+        return _ENCODED_WORD_RE.sub(EmailClient._decode_encoded_word, header)
+
+    @staticmethod
+    def _decode_encoded_word(match: re.Match) -> str:
+        """Decode a single encoded word, leaving malformed ones as-is."""
+        charset, encoding, text = match.groups()
+        try:
+            raw = _ENCODED_WORD_DECODERS[encoding.lower()](text)
+            # Strip any RFC 2231 language suffix, then resolve the codec
+            # explicitly: bytes.decode skips the lookup for empty input,
+            # which would let an unknown charset slip through as ''
+            codec = codecs.lookup(charset.split('*')[0])
+            return raw.decode(codec.name, errors='ignore')
+        except Exception:
+            return match.group(0)
+
+    def _decode_address(self, header: str) -> str:
+        """
+        Decode an address header such as From.
+
+        Plain-ASCII display names (the common case) skip MIME-word
+        decoding entirely; only an encoded name is run through
+        _decode_header.
+        """
+        if '=?' not in header:
+            return header
+        name, addr = parseaddr(header)
+        name = self._decode_header(name)
+        return f"{name} <{addr}>" if addr else name
+
+    def _parse_headers_only(self, message) -> Dict:
+        """Extract the display headers shared by both parse paths."""
+        return {
+            "subject": self._decode_header(message.get("Subject", "")),
+            "from": self._decode_address(message.get("From", "")),
+            "date": message.get("Date", "")
+        }
 
     def _parse_email(self, email_message) -> Dict:
         """Parse email message into a dictionary."""
-        subject = self._decode_header(email_message.get("Subject", ""))
-        from_ = self._decode_header(email_message.get("From", ""))
-        date = email_message.get("Date", "")
+        parsed = self._parse_headers_only(email_message)
 
         # Get email body
         body = ""
-        if email_message.is_multipart():
-            for part in email_message.walk():
-                content_type = part.get_content_type()
-                if content_type == "text/plain":
-                    try:
-                        body = part.get_payload(decode=True).decode('utf-8', errors='ignore')
-                        break
-                    except:
-                        pass
-        else:
+        text_part = self._find_text_part(email_message)
+
+        raw = b""
+        if text_part is not None:
             try:
-                body = email_message.get_payload(decode=True).decode('utf-8', errors='ignore')
+                raw = self._raw_text_payload(text_part)
             except:
-                body = str(email_message.get_payload())
+                raw = str(text_part.get_payload()).encode('utf-8', errors='ignore')
 
-        # Create preview (first 150 characters)
-        preview = body[:150].replace('\n', ' ').strip() + "..." if len(body) > 150 else body
+        body = raw.decode('utf-8', errors='ignore')
 
-        return {
-            "subject": subject,
-            "from": from_,
-            "date": date,
-            "body": body,
-            "preview": preview
-        }
+        # Create preview (first 150 characters) from a small raw slice
+        # instead of materializing and slicing the full decoded body
+        preview_src = raw[:PREVIEW_BODY_BYTES].translate(_PREVIEW_TRANS).decode('utf-8', errors='ignore')
+        preview = preview_src[:150].strip() + "..." if len(preview_src) > 150 else preview_src
+
+        parsed["body"] = body
+        parsed["preview"] = preview
+        return parsed
+
+    @staticmethod
+    def _find_text_part(email_message):
+        """
+        Locate the text/plain part to display.
+
+        Unlike walk(), which recursively yields every subpart only for
+        the caller to discard most of them, this is an explicit BFS that
+        descends only into multipart containers and text parts and stops
+        at the first usable text/plain. For multipart/alternative the
+        last text/plain child wins, matching RFC 2046's least-to-most-
+        faithful ordering.
+        """
+        if not email_message.is_multipart():
+            return email_message
+
+        pending = deque([email_message])
+        while pending:
+            part = pending.popleft()
+            maintype = part.get_content_maintype()
+
+            if maintype == "text":
+                if part.get_content_subtype() == "plain" and part.get_payload():
+                    return part
+                continue
+
+            if maintype != "multipart":
+                continue
+
+            children = part.get_payload()
+            if not isinstance(children, list):
+                continue
+
+            if part.get_content_subtype() == "alternative":
+                for child in reversed(children):
+                    if child.get_content_type() == "text/plain" and child.get_payload():
+                        return child
+
+            pending.extend(
+                child for child in children
+                if child.get_content_maintype() in ("multipart", "text")
+            )
+        return None
+
+    @staticmethod
+    def _raw_text_payload(part) -> bytes:
+        """
+        Raw bytes of a text part.
 
-    def read_emails(self, count: int = 10, folder: str = "INBOX") -> List[Dict]:
+        Identity transfer encodings (7bit/8bit/binary) skip the
+        base64/quoted-printable decode step entirely.
+        """
+        cte = (part.get('Content-Transfer-Encoding') or '7bit').strip().lower()
+        if cte in ('7bit', '8bit', 'binary'):
+            payload = part.get_payload()
+            if isinstance(payload, str):
+                return payload.encode('utf-8', errors='ignore')
+        return part.get_payload(decode=True) or b""
+
+    def _parse_email_preview(
+        self,
+        header_bytes: bytes,
+        mime_bytes: Optional[bytes],
+        preview_bytes: Optional[bytes]
+    ) -> Dict:
+        """
+        Parse a header-fields section plus a partial body slice into the
+        same dictionary shape as _parse_email, without a full MIME parse.
+        """
+        headers = BytesHeaderParser().parsebytes(header_bytes, headersonly=True)
+        parsed = self._parse_headers_only(headers)
+
+        preview = ""
+        if preview_bytes:
+            preview = self._decode_preview(mime_bytes, preview_bytes)
+
+        parsed["body"] = ""
+        parsed["preview"] = preview
+        return parsed
+
+    @staticmethod
+    def _decode_preview(mime_bytes: Optional[bytes], preview_bytes: bytes) -> str:
+        """
+        Decode a partial body slice using part 1's own MIME headers.
+
+        Quoted-printable and base64 slices are transfer-decoded and the
+        part's charset is honoured; when part 1 is not text (e.g. an
+        attachment leads a multipart/mixed message), no preview is shown
+        rather than raw attachment bytes.
+        """
+        cte = '7bit'
+        charset = 'utf-8'
+        if mime_bytes:
+            part = BytesHeaderParser().parsebytes(mime_bytes, headersonly=True)
+            if part.get_content_maintype() != 'text':
+                return ""
+            cte = (part.get('Content-Transfer-Encoding') or '7bit').strip().lower()
+            charset = part.get_content_charset() or 'utf-8'
+
+        raw = preview_bytes
+        try:
+            if cte == 'base64':
+                # Drop any trailing partial quantum so a mid-stream
+                # slice still decodes
+                raw = base64.b64decode(raw[:len(raw) - len(raw) % 4])
+            elif cte == 'quoted-printable':
+                raw = quopri.decodestring(raw)
+        except Exception:
+            raw = preview_bytes
+
+        try:
+            body = raw.translate(_PREVIEW_TRANS).decode(charset, errors='ignore')
+        except LookupError:
+            body = raw.translate(_PREVIEW_TRANS).decode('utf-8', errors='ignore')
+        return body[:150].strip() + "..." if len(body) > 150 else body
+
+    def _fetch_raw(self, mail, message_ids: List[bytes], include_body: bool):
+        """Run the batched fetch appropriate for the requested detail level."""
+        if include_body:
+            return self._fetch_batch(mail, message_ids)
+        return self._fetch_sections(mail, message_ids, PREVIEW_FETCH_SPEC)
+
+    def _fetch_shard(self, folder: str, message_ids: List[bytes], include_body: bool):
+        """Fetch one shard on its own pooled connection."""
+        with self._imap(folder) as mail:
+            return self._fetch_raw(mail, message_ids, include_body)
+
+    def _fetch_and_parse(self, mail, folder: str, message_ids: List[bytes], include_body: bool) -> List[Dict]:
+        """
+        Batch-fetch and parse messages, preserving the order of message_ids.
+
+        With include_body=False only the Subject/From/Date headers and the
+        first PREVIEW_BODY_BYTES of the first MIME part cross the wire;
+        the full RFC822 fetch is reserved for callers that need the body.
+
+        Fetches large enough to fill several shards are spread over
+        multiple pooled connections and run concurrently.
+
+        List entries for already-seen UIDs come straight from the header
+        cache; only the missing UIDs hit the network.
+        """
+        uidvalidity = getattr(mail, '_uidvalidity', None)
+        use_cache = not include_body and uidvalidity is not None
+
+        cached = {}
+        missing = message_ids
+        if use_cache:
+            missing = []
+            with self._cache_lock:
+                for uid in message_ids:
+                    entry = self._header_cache.get((folder, uidvalidity, uid))
+                    if entry is not None:
+                        cached[uid] = entry
+                    else:
+                        missing.append(uid)
+
+        shard_count = min(FETCH_CONCURRENCY, len(missing) // FETCH_SHARD_MIN)
+        if shard_count > 1:
+            shard_size = -(-len(missing) // shard_count)  # ceil division
+            shards = [
+                missing[i:i + shard_size]
+                for i in range(0, len(missing), shard_size)
+            ]
+            # Run the first shard on the connection we already hold and
+            # the rest on pooled connections in parallel
+            futures = [
+                self._executor.submit(self._fetch_shard, folder, shard, include_body)
+                for shard in shards[1:]
+            ]
+            fetched = dict(self._fetch_raw(mail, shards[0], include_body))
+            for future in futures:
+                fetched.update(future.result())
+        else:
+            fetched = self._fetch_raw(mail, missing, include_body)
+
+        emails = []
+        for num in message_ids:
+            entry = cached.get(num)
+            if entry is not None:
+                emails.append(entry)
+                continue
+
+            payload = fetched.get(num)
+            if not payload:
+                continue
+
+            if include_body:
+                parsed_email = self._parse_email(email.message_from_bytes(payload))
+            else:
+                parsed_email = self._parse_email_preview(
+                    payload.get(PREVIEW_HEADER_SECTION, b""),
+                    payload.get(PREVIEW_MIME_SECTION),
+                    payload.get(PREVIEW_BODY_SECTION)
+                )
+
+            parsed_email["id"] = num.decode()
+            if use_cache:
+                with self._cache_lock:
+                    if len(self._header_cache) >= HEADER_CACHE_MAX:
+                        self._header_cache.clear()
+                    self._header_cache[(folder, uidvalidity, num)] = parsed_email
+            emails.append(parsed_email)
+        return emails
+
+    def read_emails(self, count: int = 10, folder: str = "INBOX", include_body: bool = False) -> List[Dict]:
         """
         Read recent emails from the specified folder.
 
         Args:
             count: Number of emails to retrieve (default: 10)
             folder: Email folder to read from (default: "INBOX")
+            include_body: Fetch the full message body; when False only
+                headers and a short preview are downloaded (default: False)
 
         Returns:
             List of email dictionaries
         """
         try:
-            mail = self._connect_imap()
-            mail.select(folder)
+            with self._imap(folder) as mail:
+                # Search for all emails (UIDs are stable across sessions,
+                # unlike sequence numbers, so they can key the cache)
+                _, message_numbers = mail.uid('SEARCH', _SEARCH_ALL)
+                message_list = message_numbers[0].split()
 
-            # Search for all emails
-            _, message_numbers = mail.search(None, "ALL")
-            message_list = message_numbers[0].split()
+                # Get the most recent emails
+                recent_messages = message_list[-count:] if len(message_list) >= count else message_list
+                recent_messages.reverse()  # Most recent first
 
-            # Get the most recent emails
-            recent_messages = message_list[-count:] if len(message_list) >= count else message_list
-            recent_messages.reverse()  # Most recent first
+                emails = self._fetch_and_parse(mail, folder, recent_messages, include_body)
 
-            emails = []
-            for num in recent_messages:
-                _, msg_data = mail.fetch(num, "(RFC822)")
-                email_body = msg_data[0][1]
-                email_message = email.message_from_bytes(email_body)
-
-                parsed_email = self._parse_email(email_message)
-                parsed_email["id"] = num.decode()
-                emails.append(parsed_email)
-
-            mail.close()
-            mail.logout()
             return emails
 
         except Exception as e:
@@ -140,41 +629,43 @@ class EmailClient:
             List of matching email dictionaries
         """
         try:
-            mail = self._connect_imap()
-            mail.select(folder)
-
-            # Build search criteria
-            search_criteria = []
-            if is_unread is not None:
-                search_criteria.append("UNSEEN" if is_unread else "SEEN")
-            if sender:
-                search_criteria.append(f'FROM "{sender}"')
-
-            # Search emails
-            search_string = " ".join(search_criteria) if search_criteria else "ALL"
-            _, message_numbers = mail.search(None, search_string)
-            message_list = message_numbers[0].split()
-
-            emails = []
-            for num in message_list:
-                _, msg_data = mail.fetch(num, "(RFC822)")
-                email_body = msg_data[0][1]
-                email_message = email.message_from_bytes(email_body)
-
-                parsed_email = self._parse_email(email_message)
-
-                # Apply subject filter (IMAP doesn't support substring search)
-                if subject and subject.lower() not in parsed_email["subject"].lower():
-                    continue
-
-                parsed_email["id"] = num.decode()
-                emails.append(parsed_email)
+            with self._imap(folder) as mail:
+                # Build search criteria
+                charset = None
+                search_criteria = []
+                if is_unread is not None:
+                    search_criteria.append(_SEARCH_UNSEEN if is_unread else _SEARCH_SEEN)
+                if sender:
+                    search_criteria.append('FROM ' + self._quote_search_string(sender))
+                if subject:
+                    # SUBJECT is a case-insensitive substring match per
+                    # RFC 3501, so the server does the filtering for us
+                    if subject.isascii():
+                        search_criteria.append('SUBJECT ' + self._quote_search_string(subject))
+                    else:
+                        # Non-ASCII values must be sent as a UTF-8 literal
+                        charset = 'UTF-8'
+                        search_criteria.append('SUBJECT')
+                        mail.literal = subject.encode('utf-8')
+
+                # Search emails; skip the join when there is at most one
+                # criterion (the common case for tool calls)
+                if not search_criteria:
+                    search_string = _SEARCH_ALL
+                elif len(search_criteria) == 1:
+                    search_string = search_criteria[0]
+                else:
+                    search_string = " ".join(search_criteria)
+                if charset:
+                    _, message_numbers = mail.uid('SEARCH', 'CHARSET', charset, search_string)
+                else:
+                    _, message_numbers = mail.uid('SEARCH', search_string)
+                message_list = message_numbers[0].split()
+
+                emails = self._fetch_and_parse(mail, folder, message_list, include_body=False)
 
             # Return most recent first
             emails.reverse()
-
-            mail.close()
-            mail.logout()
             return emails
 
         except Exception as e:
@@ -182,7 +673,7 @@ class EmailClient:
 
     def send_email(
         self,
-        to: str,
+        to: Union[str, List[str]],
         subject: str,
         body: str,
         cc: Optional[str] = None
@@ -191,7 +682,8 @@ class EmailClient:
         Send an email.
 
         Args:
-            to: Recipient email address
+            to: Recipient email address, or a list of addresses; the TLS
+                handshake and SMTP login are paid once for the whole batch
             subject: Email subject
             body: Email body (plain text)
             cc: CC recipient (optional)
@@ -200,41 +692,150 @@ class EmailClient:
             Success message dictionary
         """
         try:
-            # Create message
-            msg = MIMEMultipart()
+            recipients = [to] if isinstance(to, str) else list(to)
+
+            # Create message (EmailMessage skips the legacy MIMEMultipart
+            # container for a plain-text mail)
+            msg = EmailMessage()
             msg["From"] = self.email_user
-            msg["To"] = to
+            msg["To"] = ", ".join(recipients)
             msg["Subject"] = subject
 
             if cc:
                 msg["Cc"] = cc
 
-            msg.attach(MIMEText(body, "plain"))
+            msg.set_content(body)
 
             # Send email
             with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
                 server.starttls()
                 server.login(self.email_user, self.email_pass)
-
-                recipients = [to]
-                if cc:
-                    recipients.append(cc)
-
                 server.send_message(msg)
 
             return {
                 "success": True,
-                "message": f"Email sent successfully to {to}",
+                "message": f"Email sent successfully to {', '.join(recipients)}",
                 "timestamp": datetime.now().isoformat()
             }
 
         except Exception as e:
             raise Exception(f"Failed to send email: {str(e)}")
 
+    def _status_unseen(self, folder: str) -> int:
+        """
+        Query the unseen count with STATUS — one round-trip, no SELECT
+        or SEARCH needed.
+        """
+        mail = self._acquire()
+        try:
+            status, data = mail.status(folder, '(UNSEEN)')
+        except (imaplib.IMAP4.abort, OSError):
+            self._discard(mail)
+            raise
+        self._release(mail)
+
+        if status != 'OK':
+            # e.g. NO for a nonexistent folder; imaplib doesn't raise
+            raise imaplib.IMAP4.error(f"STATUS {folder} failed: {data}")
+
+        match = _STATUS_UNSEEN_RE.search(data[0]) if data and data[0] else None
+        return int(match.group(1)) if match else 0
+
+    def _refresh_unread(self):
+        """Update the cached INBOX unseen count, ignoring transient errors."""
+        try:
+            count = self._status_unseen("INBOX")
+        except Exception:
+            return
+        with self._unread_lock:
+            self._unread_count = count
+
+    def _ensure_idle_watcher(self):
+        """Start the IDLE watcher thread on first use."""
+        with self._unread_lock:
+            if self._idle_thread is None:
+                self._idle_thread = threading.Thread(target=self._idle_loop, daemon=True)
+                self._idle_thread.start()
+
+    def _idle_loop(self):
+        """
+        Hold a dedicated connection in IMAP IDLE on INBOX and refresh the
+        cached unseen count whenever the server pushes an update, so
+        get_unread_count is a memory read instead of a poll.
+
+        If the server rejects IDLE the loop exits and callers fall back
+        to STATUS on every request; a dropped connection is re-opened.
+        """
+        while True:
+            try:
+                mail = self._connect_imap()
+                mail.select("INBOX", readonly=True)
+                if not self._idle_session(mail):
+                    # IDLE not supported: clear the cached snapshot so
+                    # callers fall back to STATUS instead of reading a
+                    # frozen count forever
+                    with self._unread_lock:
+                        self._unread_count = None
+                    self._discard(mail)
+                    return
+                # Connection lost; reconnect after a pause
+                self._discard(mail)
+            except Exception:
+                pass
+            time.sleep(IDLE_RETRY_SECONDS)
+
+    def _idle_session(self, mail) -> bool:
+        """
+        Cycle IDLE on an established connection until it drops.
+
+        Returns False if the server refuses IDLE; True when the
+        connection is lost and the caller should reconnect. Every read is
+        bounded by a socket timeout — readline() returning b'' (EOF) or
+        timing out outside the push wait means the connection is gone, so
+        a half-open server can never wedge the watcher.
+        """
+        mail.sock.settimeout(IDLE_REFRESH_SECONDS)
+        while True:
+            self._refresh_unread()
+
+            tag = mail._new_tag()
+            mail.send(tag + b' IDLE\r\n')
+            try:
+                line = mail.readline()
+            except OSError:
+                return True
+            if not line:
+                return True
+            if not line.startswith(b'+'):
+                return False
+
+            # Block until the server pushes EXISTS/EXPUNGE/FLAGS; a
+            # timeout here just means no mailbox activity, so cycle
+            # IDLE to keep the session alive
+            try:
+                if not mail.readline():
+                    return True
+            except OSError:
+                pass
+
+            mail.send(b'DONE\r\n')
+            try:
+                while True:
+                    line = mail.readline()
+                    if not line:
+                        return True
+                    if line.startswith(tag):
+                        break
+            except OSError:
+                return True
+
     def get_unread_count(self, folder: str = "INBOX") -> int:
         """
         Get count of unread emails.
 
+        For INBOX this reads the count maintained by the IDLE watcher;
+        other folders (or servers without IDLE) use a STATUS query.
+
         Args:
             folder: Email folder to check
 
@@ -242,15 +843,14 @@ class EmailClient:
             Number of unread emails
         """
         try:
-            mail = self._connect_imap()
-            mail.select(folder)
-
-            _, message_numbers = mail.search(None, "UNSEEN")
-            count = len(message_numbers[0].split()) if message_numbers[0] else 0
-
-            mail.close()
-            mail.logout()
-            return count
+            if folder == "INBOX":
+                self._ensure_idle_watcher()
+                with self._unread_lock:
+                    count = self._unread_count
+                if count is not None:
+                    return count
+
+            return self._status_unseen(folder)
 
         except Exception as e:
             raise Exception(f"Failed to get unread count: {str(e)}")
@@ -22,6 +22,18 @@ app = Server("email-alert-server")
 email_client = EmailClient()
 
 
+def _format_email_list(emails: list[dict]) -> str:
+    """Render parsed emails as a numbered markdown list with one join."""
+    parts = [
+        f"{i}. **From:** {email_data['from']}\n"
+        f"   **Subject:** {email_data['subject']}\n"
+        f"   **Date:** {email_data['date']}\n"
+        f"   **Preview:** {email_data['preview']}"
+        for i, email_data in enumerate(emails, 1)
+    ]
+    return "\n\n".join(parts)
+
+
 @app.list_tools()
 async def list_tools() -> list[Tool]:
     """List all available email tools."""
@@ -41,6 +53,11 @@ async def list_tools() -> list[Tool]:
                         "type": "string",
                         "description": "Email folder to read from (default: INBOX)",
                         "default": "INBOX"
+                    },
+                    "include_body": {
+                        "type": "boolean",
+                        "description": "Fetch full email bodies instead of just headers and a short preview (default: false)",
+                        "default": False
                     }
                 }
             }
@@ -78,8 +95,9 @@ async def list_tools() -> list[Tool]:
                 "type": "object",
                 "properties": {
                     "to": {
-                        "type": "string",
-                        "description": "Recipient email address"
+                        "type": ["string", "array"],
+                        "items": {"type": "string"},
+                        "description": "Recipient email address, or a list of addresses"
                     },
                     "subject": {
                         "type": "string",
@@ -122,19 +140,19 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent | ImageConten
         if name == "read_emails":
             count = arguments.get("count", 10)
             folder = arguments.get("folder", "INBOX")
+            include_body = arguments.get("include_body", False)
 
-            emails = email_client.read_emails(count=count, folder=folder)
+            # EmailClient is synchronous; run it off the event loop so the
+            # server stays responsive during the IMAP round-trip
+            emails = await asyncio.to_thread(
+                email_client.read_emails, count=count, folder=folder, include_body=include_body
+            )
 
             # Format response
             if not emails:
                 response = f"No emails found in {folder}."
             else:
-                response = f"📧 Found {len(emails)} email(s) in {folder}:\n\n"
-                for i, email_data in enumerate(emails, 1):
-                    response += f"{i}. **From:** {email_data['from']}\n"
-                    response += f"   **Subject:** {email_data['subject']}\n"
-                    response += f"   **Date:** {email_data['date']}\n"
-                    response += f"   **Preview:** {email_data['preview']}\n\n"
+                response = f"📧 Found {len(emails)} email(s) in {folder}:\n\n" + _format_email_list(emails)
 
             return [TextContent(type="text", text=response)]
 
@@ -144,7 +162,8 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent | ImageConten
             is_unread = arguments.get("is_unread")
             folder = arguments.get("folder", "INBOX")
 
-            emails = email_client.filter_emails(
+            emails = await asyncio.to_thread(
+                email_client.filter_emails,
                 sender=sender,
                 subject=subject,
                 is_unread=is_unread,
@@ -165,12 +184,7 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent | ImageConten
             if not emails:
                 response = f"🔍 No emails found matching criteria ({filter_text})."
             else:
-                response = f"🔍 Found {len(emails)} email(s) matching criteria ({filter_text}):\n\n"
-                for i, email_data in enumerate(emails, 1):
-                    response += f"{i}. **From:** {email_data['from']}\n"
-                    response += f"   **Subject:** {email_data['subject']}\n"
-                    response += f"   **Date:** {email_data['date']}\n"
-                    response += f"   **Preview:** {email_data['preview']}\n\n"
+                response = f"🔍 Found {len(emails)} email(s) matching criteria ({filter_text}):\n\n" + _format_email_list(emails)
 
             return [TextContent(type="text", text=response)]
 
@@ -180,26 +194,30 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent | ImageConten
             body = arguments["body"]
             cc = arguments.get("cc")
 
-            result = email_client.send_email(
+            result = await asyncio.to_thread(
+                email_client.send_email,
                 to=to,
                 subject=subject,
                 body=body,
                 cc=cc
             )
 
-            response = f"✅ Email sent successfully!\n\n"
-            response += f"**To:** {to}\n"
+            parts = [
+                "✅ Email sent successfully!\n",
+                f"**To:** {', '.join(to) if isinstance(to, list) else to}"
+            ]
             if cc:
-                response += f"**CC:** {cc}\n"
-            response += f"**Subject:** {subject}\n"
-            response += f"**Sent at:** {result['timestamp']}"
+                parts.append(f"**CC:** {cc}")
+            parts.append(f"**Subject:** {subject}")
+            parts.append(f"**Sent at:** {result['timestamp']}")
+            response = "\n".join(parts)
 
             return [TextContent(type="text", text=response)]
 
         elif name == "get_unread_count":
             folder = arguments.get("folder", "INBOX")
 
-            count = email_client.get_unread_count(folder=folder)
+            count = await asyncio.to_thread(email_client.get_unread_count, folder=folder)
 
             response = f"📬 You have **{count}** unread email(s) in {folder}."
 